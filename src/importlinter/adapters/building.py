@@ -1,3 +1,6 @@
+import hashlib
+import json
+import os
 from typing import List, Optional
 
 import grimp
@@ -24,3 +27,31 @@ class GraphBuilder(ports.GraphBuilder):
             exclude_type_checking_imports=exclude_type_checking_imports,
             cache_dir=cache_dir,
         )
+
+    def get_cache_fingerprint(
+        self,
+        root_package_names: List[str],
+        cache_dir: str,
+        include_external_packages: bool = False,
+        exclude_type_checking_imports: bool = False,
+    ) -> Optional[str]:
+        # Grimp keeps a meta file for each package, recording the modification time of each of
+        # its modules. It only reuses the imports it cached for a module if the time matches, so
+        # the same meta files (and arguments) will always produce the same graph.
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            json.dumps(
+                [grimp.__version__, include_external_packages, exclude_type_checking_imports]
+            ).encode()
+        )
+        for package_name in sorted(root_package_names):
+            meta_file_name = os.path.join(cache_dir, f"{package_name}.meta.json")
+            try:
+                with open(meta_file_name) as file:
+                    mtimes_by_module = json.load(file)
+            except (OSError, ValueError):
+                return None
+            if not isinstance(mtimes_by_module, dict):
+                return None
+            digest.update(json.dumps([package_name, sorted(mtimes_by_module.items())]).encode())
+        return digest.hexdigest()
@@ -15,6 +15,16 @@ class FileSystem(ports.FileSystem):
         with open(file_name) as file:
             return file.read()
 
+    def write(self, file_name: str, contents: str) -> None:
+        dirname = os.path.dirname(file_name)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        # Write to a temporary file first, so that a concurrent reader never sees a partial file.
+        temporary_file_name = f"{file_name}.{os.getpid()}.tmp"
+        with open(temporary_file_name, "w") as file:
+            file.write(contents)
+        os.replace(temporary_file_name, file_name)
+
     def exists(self, file_name: str) -> bool:
         return os.path.isfile(file_name)
 
@@ -3,11 +3,6 @@ from typing import Any, Dict, Optional, List
 import abc
 import sys
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
-
 from importlinter.application import file_finding
 from importlinter.application.app_config import settings
 from importlinter.application.ports import user_options as ports
@@ -87,6 +82,12 @@ class TomlFileUserOptionReader(AbstractUserOptionReader):
     potential_config_filenames = ["pyproject.toml"]
 
     def _read_config_filename(self, config_filename: str) -> Optional[UserOptions]:
+        # Only import the TOML parser once there is a TOML file to parse.
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+
         file_contents = settings.FILE_SYSTEM.read(config_filename)
         data = tomllib.loads(file_contents)
 
@@ -14,3 +14,19 @@ class GraphBuilder(abc.ABC):
         exclude_type_checking_imports: bool = False,
     ) -> ImportGraph:
         raise NotImplementedError
+
+    def get_cache_fingerprint(
+        self,
+        root_package_names: List[str],
+        cache_dir: str,
+        include_external_packages: bool = False,
+        exclude_type_checking_imports: bool = False,
+    ) -> Optional[str]:
+        """
+        Return a string identifying the graph that was last built into the cache directory.
+
+        Graphs built with the same arguments and fingerprint will be identical, so results
+        worked out for one of them can be reused for the other. Return None if the graph can't
+        be identified this way, in which case nothing will be reused.
+        """
+        return None
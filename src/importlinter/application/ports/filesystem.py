@@ -17,6 +17,13 @@ class FileSystem(abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def write(self, file_name: str, contents: str) -> None:
+        """
+        Write the contents to a file, creating any missing directories.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def exists(self, file_name: str) -> bool:
         """
@@ -16,7 +16,8 @@ class Report:
     def __init__(
         self, graph: ImportGraph, show_timings: bool, graph_building_duration: int
     ) -> None:
-        self.graph = graph
+        # Only hold on to what we need from the graph, so it can be freed once the contracts
+        # have been checked.
         self.show_timings = show_timings
         self.graph_building_duration = graph_building_duration
         self.could_not_run = False
@@ -35,6 +35,7 @@ class Timer(abc.ABC):
         end = self.get_current_time()
         start = self._start_stack.pop()
         self.duration_in_s = int(end - start)
+        self.duration_in_ms = int((end - start) * 1000)
 
     @abc.abstractmethod
     def get_current_time(self) -> float:
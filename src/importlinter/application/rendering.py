@@ -1,5 +1,7 @@
 from typing import Optional
 
+from grimp import ImportGraph
+
 from importlinter.domain.contract import Contract, ContractCheck
 
 from . import output
@@ -12,26 +14,19 @@ from .ports.reporting import Report
 def render_report(report: Report) -> None:
     """
     Output the supplied report to the console.
+
+    If the report is a StreamingReport, only the parts that haven't been output already will be.
     """
     if report.could_not_run:
         _render_could_not_run(report)
         return
 
-    if report.show_timings:
-        output.print(f"Building graph took {report.graph_building_duration}s.")
-        output.new_line()
-
-    output.print_heading("Contracts", output.HEADING_LEVEL_TWO)
-    file_count = report.module_count
-    dependency_count = report.import_count
-    output.print_heading(
-        f"Analyzed {file_count} files, {dependency_count} dependencies.",
-        output.HEADING_LEVEL_THREE,
-    )
-
-    for contract, contract_check in report.get_contracts_and_checks():
-        duration = report.get_duration(contract) if report.show_timings else None
-        render_contract_result_line(contract, contract_check, duration=duration)
+    if isinstance(report, StreamingReport):
+        report.render_heading()
+    else:
+        _render_heading(report)
+        for contract, contract_check in report.get_contracts_and_checks():
+            _render_contract_result_line_for_report(report, contract, contract_check)
 
     output.new_line()
 
@@ -47,6 +42,50 @@ def render_report(report: Report) -> None:
         _render_broken_contracts_details(report)
 
 
+class StreamingReport(Report):
+    """
+    Report that outputs the result line of each contract as soon as its check is added.
+
+    Output the rest of the report in the usual way, using render_report.
+    """
+
+    def __init__(
+        self, graph: ImportGraph, show_timings: bool, graph_building_duration: int
+    ) -> None:
+        super().__init__(
+            graph=graph, show_timings=show_timings, graph_building_duration=graph_building_duration
+        )
+        self._has_rendered_heading = False
+
+    def add_contract_check(
+        self, contract: Contract, contract_check: ContractCheck, duration: int
+    ) -> None:
+        super().add_contract_check(contract, contract_check, duration)
+        self.render_heading()
+        _render_contract_result_line_for_report(self, contract, contract_check)
+
+    def render_heading(self) -> None:
+        """
+        Output the heading of the report, unless that has already happened.
+        """
+        if not self._has_rendered_heading:
+            _render_heading(self)
+            self._has_rendered_heading = True
+
+    def render_failure(self) -> None:
+        """
+        Output a footer saying the report is incomplete, if any of it has been output already.
+
+        Call this if checking the contracts fails before the report is complete.
+        """
+        if self._has_rendered_heading:
+            output.new_line()
+            output.print_error(
+                "Could not finish checking the contracts; this report is incomplete."
+            )
+            output.new_line()
+
+
 def render_contract_result_line(
     contract: Contract, contract_check: ContractCheck, duration: Optional[int]
 ) -> None:
@@ -81,6 +120,27 @@ def render_exception(exception: Exception) -> None:
 # -----------------
 
 
+def _render_heading(report: Report) -> None:
+    if report.show_timings:
+        output.print(f"Building graph took {report.graph_building_duration}s.")
+        output.new_line()
+
+    output.print_heading("Contracts", output.HEADING_LEVEL_TWO)
+    file_count = report.module_count
+    dependency_count = report.import_count
+    output.print_heading(
+        f"Analyzed {file_count} files, {dependency_count} dependencies.",
+        output.HEADING_LEVEL_THREE,
+    )
+
+
+def _render_contract_result_line_for_report(
+    report: Report, contract: Contract, contract_check: ContractCheck
+) -> None:
+    duration = report.get_duration(contract) if report.show_timings else None
+    render_contract_result_line(contract, contract_check, duration=duration)
+
+
 def _render_could_not_run(report: Report) -> None:
     for contract_name, exception in report.invalid_contract_options.items():
         output.print_error(f'Contract "{contract_name}" is not configured correctly:')
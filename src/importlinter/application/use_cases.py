@@ -1,17 +1,45 @@
-import importlib
-from copy import copy, deepcopy
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
-
-from grimp import ImportGraph
-
+import functools
+import hashlib
+import json
+import pickle
+import sys
+from concurrent.futures import Executor
+from contextlib import closing
+from copy import deepcopy
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from grimp import DetailedImport, ImportGraph
+
+from .. import __version__
 from ..application import rendering
-from ..domain.contract import Contract, InvalidContractOptions, registry
+from ..domain import helpers
+from ..domain.contract import (
+    Contract,
+    ContractCheck,
+    InvalidContractOptions,
+    NoSuchContractType,
+    import_contract_class,
+    registry,
+)
 from . import output
 from .app_config import settings
 from .ports.reporting import Report
 from .rendering import render_exception, render_report
 from .sentinels import NotSupplied
-from .user_options import UserOptions
+from .user_options import InvalidUserOptions, UserOptions
 
 # Public functions
 # ----------------
@@ -19,6 +47,31 @@ from .user_options import UserOptions
 SUCCESS = True
 FAILURE = False
 
+# Strings in the user options that are treated as True.
+_TRUE_STRINGS = frozenset({"True", "true"})
+
+# The application layer may not import the contracts directly, so the built in contract types
+# are registered by the path to their class. Only the ones that are actually used get imported.
+_BUILT_IN_CONTRACT_TYPES: Tuple[Tuple[str, str], ...] = (
+    ("forbidden", "importlinter.contracts.forbidden.ForbiddenContract"),
+    ("layers", "importlinter.contracts.layers.LayersContract"),
+    ("independence", "importlinter.contracts.independence.IndependenceContract"),
+)
+
+# The file in the cache directory that records how long each contract took to check.
+_CONTRACT_TIMINGS_FILENAME = "contract_timings.json"
+
+# The directory within the cache directory to store the results of checking contracts.
+_RESULTS_CACHE_DIRNAME = "results"
+
+# The methods of ImportGraph that mutate it.
+_MUTATING_GRAPH_METHODS = frozenset(
+    {"add_import", "add_module", "remove_import", "remove_module", "squash_module"}
+)
+
+# The graph that contracts are checked against in worker processes.
+_worker_graph: Optional[ImportGraph] = None
+
 
 def lint_imports(
     config_filename: Optional[str] = None,
@@ -27,6 +80,7 @@ def lint_imports(
     is_debug_mode: bool = False,
     show_timings: bool = False,
     verbose: bool = False,
+    jobs: int = 1,
 ) -> bool:
     """
     Analyse whether a Python package follows a set of contracts, and report on the results.
@@ -42,6 +96,8 @@ def lint_imports(
         show_timings:       whether to show the times taken to build the graph and to check
                             each contract.
         verbose:            if True, noisily output progress as it goes along.
+        jobs:               the number of processes to check contracts in. If more than one,
+                            contracts are checked in a pool of worker processes.
 
     Returns:
         True if the linting passed, False if it didn't.
@@ -51,7 +107,16 @@ def lint_imports(
     try:
         user_options = read_user_options(config_filename=config_filename)
         _register_contract_types(user_options)
-        report = create_report(user_options, limit_to_contracts, cache_dir, show_timings, verbose)
+        report = create_report(
+            user_options,
+            limit_to_contracts,
+            cache_dir,
+            show_timings,
+            verbose,
+            jobs=jobs,
+            # In verbose mode, each result is already output as soon as it's known.
+            report_class=Report if verbose else rendering.StreamingReport,
+        )
     except Exception as e:
         if is_debug_mode:
             raise e
@@ -97,21 +162,35 @@ def create_report(
     cache_dir: Union[str, None, Type[NotSupplied]] = NotSupplied,
     show_timings: bool = False,
     verbose: bool = False,
+    report_class: Type[Report] = Report,
+    jobs: int = 1,
 ) -> Report:
     """
     Analyse whether a Python package follows a set of contracts, returning a report on the results.
 
+    A different report_class may be passed, for example a StreamingReport, which will output the
+    results of each contract as they are added to the report.
+
+    If jobs is more than one, the contracts are checked in a pool of that many worker processes.
+
     Raises:
         InvalidUserOptions: if the report could not be run due to invalid user configuration,
                             such as a module that could not be imported.
     """
+    # Find any mistakes in the contracts' configuration before the (slow) graph building.
+    contract_plan = _plan_contracts(user_options.contracts_options, limit_to_contracts)
+
     include_external_packages = _get_include_external_packages(user_options)
     exclude_type_checking_imports = _get_exclude_type_checking_imports(user_options)
 
+    resolved_cache_dir: Optional[str] = (
+        settings.DEFAULT_CACHE_DIR if cache_dir == NotSupplied else cast(Optional[str], cache_dir)
+    )
+
     with settings.TIMER as timer:
         graph = _build_graph(
             root_package_names=user_options.session_options["root_packages"],
-            cache_dir=cache_dir,
+            cache_dir=resolved_cache_dir,
             include_external_packages=include_external_packages,
             exclude_type_checking_imports=exclude_type_checking_imports,
             verbose=verbose,
@@ -123,9 +202,12 @@ def create_report(
         graph=graph,
         graph_building_duration=graph_building_duration,
         user_options=user_options,
-        limit_to_contracts=limit_to_contracts,
+        contract_plan=contract_plan,
         show_timings=show_timings,
         verbose=verbose,
+        report_class=report_class,
+        jobs=jobs,
+        cache_dir=resolved_cache_dir,
     )
 
 
@@ -133,15 +215,100 @@ def create_report(
 # -----------------
 
 
+class _GraphTransaction:
+    """
+    Wrapper around a graph that lets a contract mutate it, and then puts it back as it was.
+
+    Removing a few ignored imports is by far the most common mutation, so removed imports are
+    recorded and added back afterwards, which is much cheaper than copying the whole graph. Other
+    mutations are harder to undo, so if one happens the transaction switches to a copy instead.
+
+    Usage:
+
+        with _GraphTransaction(graph) as graph_in_transaction:
+            contract.check(graph_in_transaction, verbose=False)
+    """
+
+    def __init__(self, graph: ImportGraph) -> None:
+        self._graph = graph
+        # Imports removed from the graph, along with their details. None once the transaction has
+        # switched to a copy, as there will be nothing to put back.
+        self._removed_imports: Optional[List[Tuple[str, str, List[DetailedImport]]]] = []
+
+    def __enter__(self) -> "_GraphTransaction":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._roll_back()
+
+    def __getattr__(self, name: str) -> Any:
+        if self._removed_imports is not None:
+            if name == "remove_import":
+                return self._remove_import
+            if name in _MUTATING_GRAPH_METHODS:
+                self._switch_to_copy()
+        return getattr(self._graph, name)
+
+    def _remove_import(self, *, importer: str, imported: str) -> None:
+        assert self._removed_imports is not None
+        if self._graph.direct_import_exists(importer=importer, imported=imported):
+            import_details = self._graph.get_import_details(importer=importer, imported=imported)
+            self._removed_imports.append((importer, imported, import_details))
+        self._graph.remove_import(importer=importer, imported=imported)
+
+    def _switch_to_copy(self) -> None:
+        copy_of_graph = deepcopy(self._graph)
+        self._roll_back()
+        self._graph = copy_of_graph
+        self._removed_imports = None
+
+    def _roll_back(self) -> None:
+        if self._removed_imports is None:
+            return
+        while self._removed_imports:
+            importer, imported, import_details = self._removed_imports.pop()
+            if import_details:
+                helpers.add_imports(self._graph, import_details)
+            else:
+                self._graph.add_import(importer=importer, imported=imported)
+
+
+class _ReadOnlyGraph:
+    """
+    Wrapper around a graph that is shared between contracts, to stop any of them mutating it.
+
+    Contracts that say they won't mutate the graph aren't given a graph of their own, so if one
+    of them does try to, fail loudly rather than letting it affect the other contracts.
+    """
+
+    def __init__(self, graph: ImportGraph, contract: Contract) -> None:
+        self._graph = graph
+        self._contract = contract
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _MUTATING_GRAPH_METHODS:
+            raise RuntimeError(
+                f'Contract "{self._contract.name}" tried to mutate the graph, '
+                "but its mutates_graph property is False."
+            )
+        return getattr(self._graph, name)
+
+
 def _normalize_user_options(user_options: UserOptions) -> UserOptions:
-    normalized_options = copy(user_options)
-    if "root_packages" not in normalized_options.session_options:
-        normalized_options.session_options["root_packages"] = [
-            normalized_options.session_options["root_package"]
-        ]
-    if "root_package" in normalized_options.session_options:
-        del normalized_options.session_options["root_package"]
-    return normalized_options
+    # Build new options, rather than mutating the ones that were passed in.
+    session_options = dict(user_options.session_options)
+    if "root_packages" not in session_options:
+        session_options["root_packages"] = [session_options["root_package"]]
+    session_options.pop("root_package", None)
+    contracts_options = []
+    for contract_options in user_options.contracts_options:
+        contract_options = dict(contract_options)
+        # These strings are used for dictionary lookups, which are quicker for interned strings.
+        for key in ("type", "name"):
+            if isinstance(contract_options.get(key), str):
+                contract_options[key] = sys.intern(contract_options[key])
+        contracts_options.append(contract_options)
+    return UserOptions(session_options=session_options, contracts_options=contracts_options)
 
 
 def _build_graph(
@@ -149,11 +316,8 @@ def _build_graph(
     include_external_packages: Optional[bool],
     exclude_type_checking_imports: bool,
     verbose: bool,
-    cache_dir: Union[str, None, Type[NotSupplied]] = NotSupplied,
+    cache_dir: Optional[str],
 ) -> ImportGraph:
-    if cache_dir == NotSupplied:
-        cache_dir = settings.DEFAULT_CACHE_DIR
-
     if cache_dir:
         output.verbose_print(verbose, f"Building import graph (cache directory is {cache_dir})...")
     else:
@@ -171,68 +335,400 @@ def _build_report(
     graph: ImportGraph,
     graph_building_duration: int,
     user_options: UserOptions,
-    limit_to_contracts: Tuple[str, ...],
+    contract_plan: List[Tuple[Type[Contract], str, Dict[str, Any]]],
     show_timings: bool,
     verbose: bool,
+    report_class: Type[Report] = Report,
+    jobs: int = 1,
+    cache_dir: Optional[str] = None,
 ) -> Report:
-    report = Report(
+    report = report_class(
         graph=graph, show_timings=show_timings, graph_building_duration=graph_building_duration
     )
-    contracts_options = _filter_contract_options(
-        user_options.contracts_options, limit_to_contracts
-    )
-    for contract_options in contracts_options:
-        contract_class = registry.get_contract_class(contract_options["type"])
+    contracts: List[Contract] = []
+    for contract_class, name, contract_options in contract_plan:
         try:
             contract = contract_class(
-                name=contract_options["name"],
+                name=name,
                 session_options=user_options.session_options,
                 contract_options=contract_options,
             )
         except InvalidContractOptions as e:
-            report.add_invalid_contract_options(contract_options["name"], e)
+            report.add_invalid_contract_options(name, e)
             return report
+        contracts.append(contract)
 
-        output.verbose_print(verbose, f"Checking {contract.name}...")
-        with settings.TIMER as timer:
-            # Make a copy so that contracts can mutate the graph without affecting
-            # other contract checks.
-            copy_of_graph = deepcopy(graph)
-            check = contract.check(copy_of_graph, verbose=verbose)
-        report.add_contract_check(contract, check, duration=timer.duration_in_s)
-        if verbose:
-            rendering.render_contract_result_line(contract, check, duration=timer.duration_in_s)
+    # Contracts whose results were cached for this same graph don't need checking again.
+    graph_fingerprint = (
+        settings.GRAPH_BUILDER.get_cache_fingerprint(
+            root_package_names=user_options.session_options["root_packages"],
+            cache_dir=cache_dir,
+            include_external_packages=_get_include_external_packages(user_options),
+            exclude_type_checking_imports=_get_exclude_type_checking_imports(user_options),
+        )
+        if cache_dir and any(contract.results_are_cacheable for contract in contracts)
+        else None
+    )
+    cached_checks: List[Optional[ContractCheck]] = (
+        _read_cached_checks(contracts, graph_fingerprint, cast(str, cache_dir))
+        if graph_fingerprint
+        else [None] * len(contracts)
+    )
+    indexes_to_check = [index for index, check in enumerate(cached_checks) if check is None]
+    contracts_to_check = [contracts[index] for index in indexes_to_check]
+
+    # Checking concurrently would interleave any verbose output, and would inflate the timings
+    # of contracts that were competing with each other, so only do it when neither is needed.
+    can_check_concurrently = len(contracts_to_check) > 1 and not (verbose or show_timings)
+    check_in_processes = can_check_concurrently and jobs > 1
+    checks_and_durations: Generator[Tuple[ContractCheck, int], None, None]
+    previous_durations_in_ms: Dict[str, int] = {}
+    if check_in_processes:
+        # Start the contracts that took longest last time first, so that they don't hold
+        # everything up by being the last ones to finish.
+        previous_durations_in_ms = _read_contract_timings(cache_dir) if cache_dir else {}
+        start_order = sorted(
+            range(len(contracts_to_check)),
+            key=lambda index: previous_durations_in_ms.get(contracts_to_check[index].name, 0),
+            reverse=True,
+        )
+        checks_and_durations = _check_contracts_in_processes(
+            [contract_plan[index] for index in indexes_to_check],
+            user_options.session_options,
+            graph,
+            jobs,
+            start_order,
+        )
+    else:
+        checks_and_durations = _check_contracts_serially(contracts_to_check, graph, verbose)
+
+    # Results are added in the order the contracts were supplied, as soon as each
+    # one (and all those before it) are available.
+    durations_in_ms = {}
+    try:
+        with closing(checks_and_durations):
+            for contract, cached_check in zip(contracts, cached_checks):
+                if cached_check is None:
+                    check, duration_in_ms = next(checks_and_durations)
+                    durations_in_ms[contract.name] = duration_in_ms
+                    duration = duration_in_ms // 1000
+                    if graph_fingerprint and contract.results_are_cacheable:
+                        _write_cached_check(
+                            contract, check, graph_fingerprint, cast(str, cache_dir)
+                        )
+                else:
+                    check, duration = cached_check, 0
+                    output.verbose_print(verbose, f"Using cached result for {contract.name}.")
+                    if verbose:
+                        rendering.render_contract_result_line(contract, check, duration=duration)
+                report.add_contract_check(contract, check, duration=duration)
+    except Exception:
+        # Don't leave the results that have been streamed already looking like a complete report.
+        if isinstance(report, rendering.StreamingReport):
+            report.render_failure()
+        raise
+
+    if check_in_processes and cache_dir:
+        # Keep the timings of contracts that weren't checked this time, unless they have been
+        # removed from the configuration.
+        contract_names = {options["name"] for options in user_options.contracts_options}
+        timings_in_ms = {
+            name: duration_in_ms
+            for name, duration_in_ms in previous_durations_in_ms.items()
+            if name in contract_names
+        }
+        timings_in_ms.update(durations_in_ms)
+        _write_contract_timings(cache_dir, previous_durations_in_ms, timings_in_ms)
 
     output.verbose_print(verbose, newline=True)
     return report
 
 
+def _check_contracts_serially(
+    contracts: List[Contract], graph: ImportGraph, verbose: bool
+) -> Generator[Tuple[ContractCheck, int], None, None]:
+    for contract in contracts:
+        output.verbose_print(verbose, f"Checking {contract.name}...")
+        check, duration_in_ms = _check_contract(contract, graph, verbose)
+        if verbose:
+            rendering.render_contract_result_line(contract, check, duration=duration_in_ms // 1000)
+        yield check, duration_in_ms
+
+
+def _check_contracts_in_processes(
+    contract_plan: List[Tuple[Type[Contract], str, Dict[str, Any]]],
+    session_options: Dict[str, Any],
+    graph: ImportGraph,
+    jobs: int,
+    start_order: Sequence[int],
+) -> Generator[Tuple[ContractCheck, int], None, None]:
+    """
+    Check the contracts in a pool of worker processes.
+
+    The graph is pickled once and handed to each worker when it starts, rather than being sent
+    with every contract. Each worker builds its own contracts from the plan.
+    """
+    # Most runs don't use worker processes, so only pay for importing the machinery when they do.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Forking a process that has already started threads (which a plugin or the caller may have
+    # done) can deadlock the workers, so they are never forked from this process.
+    start_method = (
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    )
+    with ProcessPoolExecutor(
+        max_workers=min(len(contract_plan), jobs),
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_initialize_worker,
+        initargs=(pickle.dumps(graph), settings.PRINTER, settings.TIMER),
+    ) as executor:
+        yield from _map_in_start_order(
+            executor,
+            _check_contract_in_worker,
+            [
+                (contract_class, name, session_options, contract_options)
+                for contract_class, name, contract_options in contract_plan
+            ],
+            start_order,
+        )
+
+
+def _map_in_start_order(
+    executor: Executor,
+    function: Callable[..., Any],
+    arguments: List[Tuple[Any, ...]],
+    start_order: Sequence[int],
+) -> Iterator[Any]:
+    """
+    Like executor.map, but with the calls submitted in the supplied order.
+
+    Args:
+        arguments:   the arguments for each call to the function.
+        start_order: the indexes of the arguments, in the order the calls should be submitted.
+
+    Returns:
+        The results, in the order of the arguments (not the start order).
+    """
+    futures = {index: executor.submit(function, *arguments[index]) for index in start_order}
+    for index in range(len(arguments)):
+        yield futures[index].result()
+
+
+def _initialize_worker(pickled_graph: bytes, printer: Any, timer: Any) -> None:
+    global _worker_graph
+
+    # The workers don't inherit the settings from this process.
+    settings.configure(PRINTER=printer, TIMER=timer)
+    _worker_graph = pickle.loads(pickled_graph)
+
+
+def _check_contract_in_worker(
+    contract_class: Type[Contract],
+    name: str,
+    session_options: Dict[str, Any],
+    contract_options: Dict[str, Any],
+) -> Tuple[ContractCheck, int]:
+    assert _worker_graph is not None, "Worker was not initialized."
+    contract = contract_class(
+        name=name,
+        session_options=session_options,
+        contract_options=contract_options,
+    )
+    return _check_contract(contract, _worker_graph, verbose=False)
+
+
+def _check_contract(
+    contract: Contract, graph: ImportGraph, verbose: bool
+) -> Tuple[ContractCheck, int]:
+    """
+    Check the supplied contract, without letting it affect the graph for other contract checks.
+
+    The graph must not be in use by any other contract check at the same time, unless the
+    contract won't mutate it.
+
+    Returns:
+        Tuple of the contract check and the duration of the check, in milliseconds.
+    """
+    with settings.TIMER as timer:
+        if contract.mutates_graph:
+            # Let the contract mutate the graph, then put it back.
+            with _GraphTransaction(graph) as graph_in_transaction:
+                check = contract.check(cast(ImportGraph, graph_in_transaction), verbose=verbose)
+        else:
+            check = contract.check(
+                cast(ImportGraph, _ReadOnlyGraph(graph, contract)), verbose=verbose
+            )
+    return check, timer.duration_in_ms
+
+
+def _read_contract_timings(cache_dir: str) -> Dict[str, int]:
+    """
+    Return how long each contract took to check last time, in milliseconds, keyed by contract
+    name.
+    """
+    filename = settings.FILE_SYSTEM.join(cache_dir, _CONTRACT_TIMINGS_FILENAME)
+    try:
+        if not settings.FILE_SYSTEM.exists(filename):
+            return {}
+        timings = json.loads(settings.FILE_SYSTEM.read(filename))
+    except (OSError, ValueError):
+        # The timings are only used to decide which contracts to start first, so it doesn't
+        # matter if they're unreadable.
+        return {}
+    return timings if isinstance(timings, dict) else {}
+
+
+def _write_contract_timings(
+    cache_dir: str, previous_timings: Dict[str, int], timings: Dict[str, int]
+) -> None:
+    """
+    Record how long each contract took to check, in milliseconds, keyed by contract name.
+
+    The timings are only used to decide which order to start the contracts in, so the file
+    isn't rewritten unless that order would change.
+    """
+    if _order_slowest_first(timings) == _order_slowest_first(previous_timings):
+        return
+    filename = settings.FILE_SYSTEM.join(cache_dir, _CONTRACT_TIMINGS_FILENAME)
+    try:
+        settings.FILE_SYSTEM.write(filename, json.dumps(timings))
+    except OSError:
+        pass
+
+
+def _order_slowest_first(timings: Dict[str, int]) -> List[str]:
+    return sorted(timings, key=timings.__getitem__, reverse=True)
+
+
+def _read_cached_checks(
+    contracts: List[Contract], graph_fingerprint: str, cache_dir: str
+) -> List[Optional[ContractCheck]]:
+    """
+    Return the cached result of checking each contract against the graph with the supplied
+    fingerprint, or None if there isn't one.
+    """
+    cached_checks: List[Optional[ContractCheck]] = []
+    for contract in contracts:
+        check = None
+        if contract.results_are_cacheable:
+            filename = _get_cached_check_filename(contract, cache_dir)
+            try:
+                if settings.FILE_SYSTEM.exists(filename):
+                    cached = json.loads(settings.FILE_SYSTEM.read(filename))
+                    if cached["graph_fingerprint"] == graph_fingerprint:
+                        check = ContractCheck(
+                            kept=cached["kept"],
+                            metadata=cached["metadata"],
+                            warnings=cached["warnings"],
+                        )
+            except (OSError, ValueError, KeyError, TypeError):
+                # A cache that can't be read is no worse than a cache miss.
+                pass
+        cached_checks.append(check)
+    return cached_checks
+
+
+def _write_cached_check(
+    contract: Contract, check: ContractCheck, graph_fingerprint: str, cache_dir: str
+) -> None:
+    try:
+        serialized = json.dumps(
+            {
+                "graph_fingerprint": graph_fingerprint,
+                "kept": check.kept,
+                "metadata": check.metadata,
+                "warnings": check.warnings,
+            },
+            default=_serialize_set,
+        )
+    except (TypeError, ValueError):
+        # The result can't be stored as JSON, so it will just be worked out again next time.
+        return
+    # Each contract has a single cache file, so results for old graphs are overwritten rather
+    # than accumulating.
+    try:
+        settings.FILE_SYSTEM.write(_get_cached_check_filename(contract, cache_dir), serialized)
+    except OSError:
+        pass
+
+
+def _serialize_set(value: Any) -> List[Any]:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"{value!r} is not JSON serializable.")
+
+
+def _get_cached_check_filename(contract: Contract, cache_dir: str) -> str:
+    contract_class = contract.__class__
+    key = json.dumps(
+        [
+            __version__,
+            f"{contract_class.__module__}.{contract_class.__qualname__}",
+            dict(contract.session_options),
+            contract.contract_options,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return settings.FILE_SYSTEM.join(cache_dir, _RESULTS_CACHE_DIRNAME, f"{digest}.json")
+
+
+def _plan_contracts(
+    contracts_options: List[Dict[str, Any]], limit_to_contracts: Tuple[str, ...]
+) -> List[Tuple[Type[Contract], str, Dict[str, Any]]]:
+    """
+    Work out everything needed to build each contract, so building them is just a matter of
+    unpacking tuples.
+
+    Raises:
+        InvalidUserOptions: if any of the contracts are of a type that isn't registered.
+    """
+    contract_plan = []
+    unknown_types = []
+    for contract_options in _filter_contract_options(contracts_options, limit_to_contracts):
+        contract_type = contract_options["type"]
+        name = contract_options["name"]
+        try:
+            contract_class = registry.get_contract_class(contract_type)
+        except NoSuchContractType:
+            unknown_types.append(f"'{contract_type}' (used by contract '{name}')")
+            continue
+        contract_plan.append((contract_class, name, contract_options))
+    if unknown_types:
+        raise InvalidUserOptions(f"Unknown contract types: {', '.join(unknown_types)}.")
+    return contract_plan
+
+
 def _filter_contract_options(
     contracts_options: List[Dict[str, Any]], limit_to_contracts: Tuple[str, ...]
 ) -> List[Dict[str, Any]]:
-    if limit_to_contracts:
-        # Validate the supplied contract ids.
-        registered_contract_ids = {option["id"] for option in contracts_options}
-        missing_contract_ids = set(limit_to_contracts) - registered_contract_ids
-        if missing_contract_ids:
-            if len(missing_contract_ids) == 1:
-                raise ValueError(
-                    f"Could not find contract '{missing_contract_ids.pop()}'.\n\n"
-                    "You asked to limit the check to that contract, but nothing exists "
-                    "with that id."
-                )
-            else:
-                raise ValueError(
-                    "Could not find the following contract ids: "
-                    f"{', '.join(sorted(missing_contract_ids))}.\n\n"
-                    "You asked to limit the check to those contracts, but there are no "
-                    "contracts with those ids."
-                )
-        else:
-            return [o for o in contracts_options if o["id"] in limit_to_contracts]
-    else:
+    if not limit_to_contracts:
         return contracts_options
 
+    # Use a set, so filtering the contracts doesn't need a scan of the tuple for each one.
+    contract_ids_to_check = set(limit_to_contracts)
+    filtered_contracts_options = [o for o in contracts_options if o["id"] in contract_ids_to_check]
+    # Validate the supplied contract ids, using only the (usually few) contracts that matched.
+    missing_contract_ids = contract_ids_to_check.difference(
+        o["id"] for o in filtered_contracts_options
+    )
+    if len(missing_contract_ids) == 1:
+        raise ValueError(
+            f"Could not find contract '{missing_contract_ids.pop()}'.\n\n"
+            "You asked to limit the check to that contract, but nothing exists "
+            "with that id."
+        )
+    elif missing_contract_ids:
+        raise ValueError(
+            "Could not find the following contract ids: "
+            f"{', '.join(sorted(missing_contract_ids))}.\n\n"
+            "You asked to limit the check to those contracts, but there are no "
+            "contracts with those ids."
+        )
+    return filtered_contracts_options
+
 
 def _register_contract_types(user_options: UserOptions) -> None:
     contract_types = _get_built_in_contract_types() + _get_plugin_contract_types(user_options)
@@ -240,89 +736,64 @@ def _register_contract_types(user_options: UserOptions) -> None:
         registry.register(contract_class, name)
 
 
-def _get_built_in_contract_types() -> List[Tuple[str, Type[Contract]]]:
-    return list(
-        map(
-            _parse_contract_type_string,
-            [
-                "forbidden: importlinter.contracts.forbidden.ForbiddenContract",
-                "layers: importlinter.contracts.layers.LayersContract",
-                "independence: importlinter.contracts.independence.IndependenceContract",
-            ],
-        )
-    )
+def _get_built_in_contract_types() -> List[Tuple[str, Union[Type[Contract], str]]]:
+    return list(_BUILT_IN_CONTRACT_TYPES)
 
 
-def _get_plugin_contract_types(user_options: UserOptions) -> List[Tuple[str, Type[Contract]]]:
-    contract_types = []
+def _get_plugin_contract_types(
+    user_options: UserOptions,
+) -> List[Tuple[str, Union[Type[Contract], str]]]:
+    contract_types: List[Tuple[str, Union[Type[Contract], str]]] = []
     if "contract_types" in user_options.session_options:
         for contract_type_string in user_options.session_options["contract_types"]:
             contract_types.append(_parse_contract_type_string(contract_type_string))
     return contract_types
 
 
-def _parse_contract_type_string(string) -> Tuple[str, Type[Contract]]:
-    components = string.split(": ")
-    assert len(components) == 2
-    name, contract_class_string = components
-    contract_class = _string_to_class(contract_class_string)
-    if not issubclass(contract_class, Contract):
-        raise TypeError(f"{contract_class} is not a subclass of Contract.")
-    return name, contract_class
-
-
-def _string_to_class(string: str) -> Type:
-    """
-    Parse a string into a Python class.
-
-    Args:
-        string: a fully qualified string of a class, e.g. 'mypackage.foo.MyClass'.
-
-    Returns:
-        The class.
-    """
-    components = string.split(".")
-    class_name = components[-1]
-    module_name = ".".join(components[:-1])
-    module = importlib.import_module(module_name)
-    cls = getattr(module, class_name)
-    assert isinstance(cls, type)
-    return cls
+# Each string is only parsed and validated once per process; the same contract types are
+# registered on every call to lint_imports.
+@functools.lru_cache(maxsize=None)
+def _parse_contract_type_string(string: str) -> Tuple[str, Type[Contract]]:
+    name, separator, contract_class_string = string.partition(": ")
+    if not separator or ": " in contract_class_string:
+        raise InvalidUserOptions(
+            f"Invalid contract type '{string}': expected the form "
+            "'name: path.to.ContractClass'."
+        )
+    return sys.intern(name), import_contract_class(contract_class_string)
 
 
 def _get_include_external_packages(user_options: UserOptions) -> Optional[bool]:
     """
     Get a boolean (or None) for the include_external_packages option in user_options.
     """
-    try:
-        include_external_packages_str = user_options.session_options["include_external_packages"]
-    except KeyError:
-        return None
-    # Cast the string to a boolean.
-    return include_external_packages_str in ("True", "true")
+    return _get_boolean_option(user_options, "include_external_packages", default=None)
 
 
 def _get_exclude_type_checking_imports(user_options: UserOptions) -> bool:
     """
     Get a boolean for the exclude_type_checking_imports option in user_options.
     """
-    try:
-        exclude_type_checking_imports_str = user_options.session_options[
-            "exclude_type_checking_imports"
-        ]
-    except KeyError:
-        return False
-    # Cast the string to a boolean.
-    return exclude_type_checking_imports_str in ("True", "true")
+    return bool(_get_boolean_option(user_options, "exclude_type_checking_imports", default=False))
 
 
 def _get_show_timings(user_options: UserOptions) -> bool:
     """
-    Get a boolean (or None) for the show_timings option in user_options.
+    Get a boolean for the show_timings option in user_options.
     """
-    try:
-        show_timings_str = user_options.session_options["show_timings"]
-    except KeyError:
-        return False
+    return bool(_get_boolean_option(user_options, "show_timings", default=False))
+
+
+def _get_boolean_option(
+    user_options: UserOptions, name: str, default: Optional[bool]
+) -> Optional[bool]:
+    """
+    Get a boolean for a session option, which will have been supplied as a string.
+
+    Returns the default if the option wasn't supplied.
+    """
+    value = user_options.session_options.get(name)
+    if value is None:
+        return default
     # Cast the string to a boolean.
-    return show_timings_str in ("True", "true")
+    return value in _TRUE_STRINGS
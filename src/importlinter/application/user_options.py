@@ -14,6 +14,8 @@ class UserOptions:
         - contracts_options: List of the options that will be used to build the contracts.
     """
 
+    __slots__ = ("session_options", "contracts_options")
+
     def __init__(
         self, session_options: Dict[str, Any], contracts_options: List[Dict[str, Any]]
     ) -> None:
@@ -21,6 +23,8 @@ class UserOptions:
         self.contracts_options = contracts_options
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, UserOptions):
             return False
         return (self.session_options == other.session_options) and (
@@ -1,14 +1,14 @@
+from __future__ import annotations
+
+import logging
 import os
 import sys
-from logging import config as logging_config
-from typing import Optional, Tuple, Type, Union
 
 import click
 
 from importlinter.application.sentinels import NotSupplied
 
 from . import configuration
-from .application import use_cases
 
 configuration.configure()
 
@@ -20,7 +20,7 @@ EXIT_STATUS_ERROR = 1
 @click.option("--config", default=None, help="The config file to use.")
 @click.option(
     "--contract",
-    default=list,
+    default=(),
     multiple=True,
     help="Limit the check to the supplied contract identifier. May be passed multiple times.",
 )
@@ -37,14 +37,21 @@ EXIT_STATUS_ERROR = 1
     is_flag=True,
     help="Noisily output progress as we go along.",
 )
+@click.option(
+    "--jobs",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Check contracts in this many processes (defaults to 1).",
+)
 def lint_imports_command(
-    config: Optional[str],
-    contract: Tuple[str, ...],
-    cache_dir: Optional[str],
+    config: str | None,
+    contract: tuple[str, ...],
+    cache_dir: str | None,
     no_cache: bool,
     debug: bool,
     show_timings: bool,
     verbose: bool,
+    jobs: int,
 ) -> int:
     """
     Check that a project adheres to a set of contracts.
@@ -57,18 +64,20 @@ def lint_imports_command(
         is_debug_mode=debug,
         show_timings=show_timings,
         verbose=verbose,
+        jobs=jobs,
     )
     sys.exit(exit_code)
 
 
 def lint_imports(
-    config_filename: Optional[str] = None,
-    limit_to_contracts: Tuple[str, ...] = (),
-    cache_dir: Optional[str] = None,
+    config_filename: str | None = None,
+    limit_to_contracts: tuple[str, ...] = (),
+    cache_dir: str | None = None,
     no_cache: bool = False,
     is_debug_mode: bool = False,
     show_timings: bool = False,
     verbose: bool = False,
+    jobs: int = 1,
 ) -> int:
     """
     Check that a project adheres to a set of contracts.
@@ -85,12 +94,20 @@ def lint_imports(
         show_timings:       whether to show the times taken to build the graph and to check
                             each contract.
         verbose:            if True, noisily output progress as it goes along.
+        jobs:               the number of processes to check contracts in.
 
     Returns:
         EXIT_STATUS_SUCCESS or EXIT_STATUS_ERROR.
     """
-    # Add current directory to the path, as this doesn't happen automatically.
-    sys.path.insert(0, os.getcwd())
+    # Imported here rather than at module level, so that invocations that never get this far
+    # (such as --help) don't pay for importing it.
+    from .application import use_cases
+
+    # Add current directory to the path, as this doesn't happen automatically. Don't add it
+    # again if it's already there, so repeated calls in one process don't keep growing it.
+    working_directory = os.getcwd()
+    if working_directory not in sys.path:
+        sys.path.insert(0, working_directory)
 
     _configure_logging(verbose)
 
@@ -103,6 +120,7 @@ def lint_imports(
         is_debug_mode=is_debug_mode,
         show_timings=show_timings,
         verbose=verbose,
+        jobs=jobs,
     )
 
     if passed:
@@ -112,8 +130,8 @@ def lint_imports(
 
 
 def _combine_caching_arguments(
-    cache_dir: Optional[str], no_cache: bool
-) -> Union[str, None, Type[NotSupplied]]:
+    cache_dir: str | None, no_cache: bool
+) -> str | None | type[NotSupplied]:
     if no_cache:
         return None
     if cache_dir is None:
@@ -122,23 +140,11 @@ def _combine_caching_arguments(
 
 
 def _configure_logging(verbose: bool) -> None:
-    logger_names = ("importlinter", "grimp", "_rustgrimp")
-    logging_config.dictConfig(
-        {
-            "version": 1,
-            "handlers": {
-                "console": {
-                    "class": "logging.StreamHandler",
-                    "level": "INFO" if verbose else "WARNING",
-                    "stream": "ext://sys.stdout",
-                },
-            },
-            "loggers": {
-                logger_name: {
-                    "level": "INFO",
-                    "handlers": ["console"],
-                }
-                for logger_name in logger_names
-            },
-        }
-    )
+    # Configured directly, rather than through logging.config, which is slow to import.
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(logging.INFO if verbose else logging.WARNING)
+    for logger_name in ("importlinter", "grimp", "_rustgrimp"):
+        logger = logging.getLogger(logger_name)
+        logger.setLevel(logging.INFO)
+        # Replace any handlers, so that calling this more than once doesn't duplicate output.
+        logger.handlers = [handler]
@@ -5,8 +5,19 @@ from .adapters.timing import SystemClockTimer
 from .adapters.user_options import IniFileUserOptionReader, TomlFileUserOptionReader
 from .application.app_config import settings
 
+_is_configured = False
+
 
 def configure():
+    """
+    Configure the application to use the real adapters.
+
+    Each entry point calls this when it is imported; only the first call does anything.
+    """
+    global _is_configured
+    if _is_configured:
+        return
+    _is_configured = True
     settings.configure(
         USER_OPTION_READERS={
             "ini": IniFileUserOptionReader(),
@@ -9,6 +9,7 @@ without warning.
 from __future__ import annotations
 
 import itertools
+import sys
 from typing import List, Optional, Sequence, Tuple, Union
 
 import grimp
@@ -37,13 +38,18 @@ class DetailedChain(TypedDict):
 
 def render_chain_data(chain_data: DetailedChain) -> None:
     main_chain = chain_data["chain"]
-    _render_direct_import(main_chain[0], extra_firsts=chain_data["extra_firsts"], first_line=True)
+    lines = _format_direct_import(
+        main_chain[0], extra_firsts=chain_data["extra_firsts"], first_line=True
+    )
 
     for direct_import in main_chain[1:-1]:
-        _render_direct_import(direct_import)
+        lines.extend(_format_direct_import(direct_import))
 
     if len(main_chain) > 1:
-        _render_direct_import(main_chain[-1], extra_lasts=chain_data["extra_lasts"])
+        lines.extend(_format_direct_import(main_chain[-1], extra_lasts=chain_data["extra_lasts"]))
+
+    # Print the whole chain at once, rather than a line at a time.
+    output.print_error("\n".join(lines), bold=False)
 
 
 def find_segments(
@@ -60,9 +66,7 @@ def find_segments(
         if len(chain) == 2:
             raise ValueError("Direct chain found - these should have been removed.")
         segment: List[Link] = []
-        for importer_in_chain, imported_in_chain in [
-            (chain[i], chain[i + 1]) for i in range(len(chain) - 1)
-        ]:
+        for importer_in_chain, imported_in_chain in pairwise(chain):
             import_details = reference_graph.get_import_details(
                 importer=importer_in_chain, imported=imported_in_chain
             )
@@ -144,17 +148,22 @@ def format_line_numbers(line_numbers: Sequence[Optional[int]]) -> str:
     Unknown line numbers should be provided as a None value in the sequence. E.g.
     (None,) will be returned as "l.?".
     """
+    # Joining a list is quicker than joining a generator, which str.join would have to
+    # turn into a list anyway.
     return ", ".join(
-        "l.?" if line_number is None else f"l.{line_number}" for line_number in line_numbers
+        ["l.?" if line_number is None else f"l.{line_number}" for line_number in line_numbers]
     )
 
 
-def _render_direct_import(
+def _format_direct_import(
     direct_import,
     first_line: bool = False,
     extra_firsts: Optional[List] = None,
     extra_lasts: Optional[List] = None,
-) -> None:
+) -> List[str]:
+    """
+    Return the lines of output describing a single import in a chain.
+    """
     import_strings = []
     if extra_firsts:
         for position, source in enumerate([direct_import] + extra_firsts[:-1]):
@@ -177,11 +186,10 @@ def _render_direct_import(
             line_numbers = format_line_numbers(destination["line_numbers"])
             import_strings.append(f"{indent_string}& {imported} ({line_numbers})")
 
-    for position, import_string in enumerate(import_strings):
-        if first_line and position == 0:
-            output.print_error(f"- {import_string}", bold=False)
-        else:
-            output.print_error(f"  {import_string}", bold=False)
+    return [
+        f"- {import_string}" if first_line and position == 0 else f"  {import_string}"
+        for position, import_string in enumerate(import_strings)
+    ]
 
 
 def build_detailed_chain_from_route(route: grimp.Route, graph: grimp.ImportGraph) -> DetailedChain:
@@ -229,13 +237,17 @@ def get_line_numbers(
     return line_numbers
 
 
-def pairwise(iterable):
-    """
-    Return successive overlapping pairs taken from the input iterable.
-    pairwise('ABCDEFG') --> AB BC CD DE EF FG
+if sys.version_info >= (3, 10):
+    from itertools import pairwise
+else:
 
-    TODO: Replace with itertools.pairwise once on Python 3.10.
-    """
-    a, b = itertools.tee(iterable)
-    next(b, None)
-    return zip(a, b)
+    def pairwise(iterable):
+        """
+        Return successive overlapping pairs taken from the input iterable.
+        pairwise('ABCDEFG') --> AB BC CD DE EF FG
+
+        Backport of itertools.pairwise, which is available from Python 3.10.
+        """
+        a, b = itertools.tee(iterable)
+        next(b, None)
+        return zip(a, b)
@@ -40,6 +40,15 @@ class ForbiddenContract(Contract):
     allow_indirect_imports = fields.BooleanField(required=False, default=False)
     unmatched_ignore_imports_alerting = fields.EnumField(AlertLevel, default=AlertLevel.ERROR)
 
+    @property
+    def mutates_graph(self) -> bool:
+        # The only mutation is the removal of any ignored imports.
+        return bool(self.ignore_imports)
+
+    @property
+    def results_are_cacheable(self) -> bool:
+        return True
+
     def check(self, graph: ImportGraph, verbose: bool) -> ContractCheck:
         is_kept = True
         invalid_chains = []
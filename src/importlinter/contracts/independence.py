@@ -51,6 +51,15 @@ class IndependenceContract(Contract):
     ignore_imports = fields.SetField(subfield=fields.ImportExpressionField(), required=False)
     unmatched_ignore_imports_alerting = fields.EnumField(AlertLevel, default=AlertLevel.ERROR)
 
+    @property
+    def mutates_graph(self) -> bool:
+        # The only mutation is the removal of any ignored imports.
+        return bool(self.ignore_imports)
+
+    @property
+    def results_are_cacheable(self) -> bool:
+        return True
+
     def check(self, graph: ImportGraph, verbose: bool) -> ContractCheck:
         warnings = contract_utils.remove_ignored_imports(
             graph=graph,
@@ -129,6 +129,15 @@ class LayersContract(Contract):
     exhaustive = fields.BooleanField(default=False)
     exhaustive_ignores = fields.SetField(subfield=fields.StringField(), required=False)
 
+    @property
+    def mutates_graph(self) -> bool:
+        # The only mutation is the removal of any ignored imports.
+        return bool(self.ignore_imports)
+
+    @property
+    def results_are_cacheable(self) -> bool:
+        return True
+
     def validate(self) -> None:
         if self.exhaustive and not self.containers:
             raise InvalidContractOptions(
@@ -1,5 +1,6 @@
 import abc
-from typing import Any, Dict, List, Optional, Type
+import importlib
+from typing import Any, Dict, List, Optional, Type, Union
 
 from grimp import ImportGraph
 
@@ -70,11 +71,34 @@ class Contract(abc.ABC):
     def _get_field(cls, field_name: str) -> fields.Field:
         return getattr(cls, field_name)
 
+    @property
+    def mutates_graph(self) -> bool:
+        """
+        Whether checking the contract may mutate the graph.
+
+        If so, any changes the contract makes to the graph are undone once it has been checked.
+        If not, the contract shares the graph with other contracts, and isn't allowed to mutate
+        it. Override this to return False on contracts that only ever read from the graph.
+        """
+        return True
+
+    @property
+    def results_are_cacheable(self) -> bool:
+        """
+        Whether the result of checking the contract depends only on the graph and the options.
+
+        If so, the result may be cached and reused for as long as the graph and options are
+        unchanged. Override this to return True on contracts that don't depend on anything else.
+        """
+        return False
+
     @abc.abstractmethod
     def check(self, graph: ImportGraph, verbose: bool) -> "ContractCheck":
         """
         Args:
-            graph:   Copy of the ImportGraph. May be mutated without affecting other contracts.
+            graph:   The ImportGraph, or a wrapper with the same interface. Unless mutates_graph
+                     returns False, it may be mutated: the changes are undone once this method
+                     returns, so the graph must not be kept for use after that.
             verbose: Whether to output progress noisily. Can be used as a flag to pass
                      to output.verbose_print.
         """
@@ -118,17 +142,44 @@ class NoSuchContractType(Exception):
 
 
 class ContractRegistry:
-    def __init__(self):
-        self._classes_by_name = {}
+    def __init__(self) -> None:
+        self._classes_by_name: Dict[str, Union[Type[Contract], str]] = {}
 
-    def register(self, contract_class: Type[Contract], name: str) -> None:
+    def register(self, contract_class: Union[Type[Contract], str], name: str) -> None:
+        """
+        Register a contract class under the supplied name.
+
+        The class may instead be passed as a fully qualified string, e.g.
+        'mypackage.foo.MyContract', in which case it isn't imported until it is first used.
+        """
         self._classes_by_name[name] = contract_class
 
     def get_contract_class(self, name: str) -> Type[Contract]:
         try:
-            return self._classes_by_name[name]
+            contract_class = self._classes_by_name[name]
         except KeyError:
             raise NoSuchContractType(name)
+        if isinstance(contract_class, str):
+            contract_class = self._classes_by_name[name] = import_contract_class(contract_class)
+        return contract_class
+
+
+def import_contract_class(string: str) -> Type[Contract]:
+    """
+    Import a contract class from a string.
+
+    Args:
+        string: a fully qualified string of a class, e.g. 'mypackage.foo.MyContract'.
+
+    Raises:
+        TypeError if the string doesn't refer to a subclass of Contract.
+    """
+    module_name, _, class_name = string.rpartition(".")
+    module = importlib.import_module(module_name)
+    contract_class = getattr(module, class_name)
+    if not isinstance(contract_class, type) or not issubclass(contract_class, Contract):
+        raise TypeError(f"{contract_class} is not a subclass of Contract.")
+    return contract_class
 
 
 registry = ContractRegistry()
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from typing import List, Optional
 
 from grimp.adaptors.graph import ImportGraph
@@ -24,6 +26,12 @@ class FakeGraphBuilder(GraphBuilder):
     -------------------------------
 
     The arguments the builder was last called with are stored in self.build_arguments.
+
+    Cache fingerprints
+    ------------------
+
+    The cache fingerprint is worked out from the modules and imports in the injected graph,
+    so it will change whenever the graph does.
     """
 
     def build(
@@ -43,3 +51,22 @@ class FakeGraphBuilder(GraphBuilder):
 
     def inject_graph(self, graph: ImportGraph) -> None:
         self._graph = graph
+
+    def get_cache_fingerprint(
+        self,
+        root_package_names: List[str],
+        cache_dir: str,
+        include_external_packages: bool = False,
+        exclude_type_checking_imports: bool = False,
+    ) -> Optional[str]:
+        graph = getattr(self, "_graph", ImportGraph())
+        digest = hashlib.blake2b(digest_size=16)
+        for module in sorted(graph.modules):
+            digest.update(json.dumps([module, graph.is_module_squashed(module)]).encode())
+            for imported in sorted(graph.find_modules_directly_imported_by(module)):
+                import_details = sorted(
+                    json.dumps(details, sort_keys=True)
+                    for details in graph.get_import_details(importer=module, imported=imported)
+                )
+                digest.update(json.dumps([imported, import_details]).encode())
+        return digest.hexdigest()
@@ -36,3 +36,14 @@ class TestCaching:
 
             assert meta_file.exists()
             assert data_file.exists()
+
+    def test_contract_results_are_reused(self, capsys):
+        os.chdir(testpackage_directory)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cli.lint_imports(cache_dir=cache_dir, is_debug_mode=True)
+            capsys.readouterr()
+            result = cli.lint_imports(cache_dir=cache_dir, is_debug_mode=True, verbose=True)
+
+        assert result == cli.EXIT_STATUS_SUCCESS
+        assert "Using cached result for Test independence contract." in capsys.readouterr().out
@@ -87,6 +87,15 @@ def test_lint_imports_debug_mode(is_debug_mode):
         assert cli.EXIT_STATUS_ERROR == cli.lint_imports(**kwargs)
 
 
+def test_working_directory_is_only_added_to_path_once():
+    os.chdir(testpackage_directory)
+
+    cli.lint_imports()
+    cli.lint_imports()
+
+    assert sys.path.count(os.getcwd()) == 1
+
+
 def test_show_timings_smoke_test():
     os.chdir(testpackage_directory)
     assert cli.EXIT_STATUS_SUCCESS == cli.lint_imports(show_timings=True)
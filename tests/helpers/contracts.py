@@ -103,3 +103,55 @@ class MutationCheckContract(Contract):
 
     def render_broken_contract(self, check: "ContractCheck") -> None:
         raise NotImplementedError
+
+
+class ReadOnlyContract(Contract):
+    """
+    Contract that declares it won't mutate the graph, and records the graph it was passed.
+    """
+
+    @property
+    def mutates_graph(self) -> bool:
+        return False
+
+    def check(self, graph: ImportGraph, verbose: bool) -> ContractCheck:
+        return ContractCheck(kept=True, metadata={"graph": graph})
+
+    def render_broken_contract(self, check: "ContractCheck") -> None:
+        raise NotImplementedError
+
+
+class UndeclaredMutationContract(Contract):
+    """
+    Contract that mutates the graph, despite declaring that it won't.
+    """
+
+    @property
+    def mutates_graph(self) -> bool:
+        return False
+
+    def check(self, graph: ImportGraph, verbose: bool) -> ContractCheck:
+        graph.add_module("added-by-contract")
+        return ContractCheck(kept=True)
+
+    def render_broken_contract(self, check: "ContractCheck") -> None:
+        raise NotImplementedError
+
+
+class CacheableContract(Contract):
+    """
+    Contract whose results may be cached, and which counts how many times it has been checked.
+    """
+
+    check_count = 0
+
+    @property
+    def results_are_cacheable(self) -> bool:
+        return True
+
+    def check(self, graph: ImportGraph, verbose: bool) -> ContractCheck:
+        CacheableContract.check_count += 1
+        return ContractCheck(kept=True, metadata={"modules": set(graph.modules)})
+
+    def render_broken_contract(self, check: "ContractCheck") -> None:
+        raise NotImplementedError
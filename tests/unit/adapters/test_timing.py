@@ -13,6 +13,13 @@ class TestSystemClockTimer:
 
         assert timer.duration_in_s >= some_seconds
 
+    def test_duration_in_ms(self):
+        with SystemClockTimer() as timer:
+            time.sleep(0.2)
+
+        assert 200 <= timer.duration_in_ms < 2000
+        assert timer.duration_in_s == 0
+
     def test_nested(self):
         timer = SystemClockTimer()
 
@@ -1,23 +1,70 @@
+import json
 import re
 import string
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 import pytest
 from grimp.adaptors.graph import ImportGraph
 
 from importlinter.application.app_config import settings
 from importlinter.application.ports.building import GraphBuilder
-from importlinter.application.use_cases import FAILURE, SUCCESS, create_report, lint_imports
-from importlinter.application.user_options import UserOptions
+from importlinter.application.rendering import StreamingReport
+from importlinter.application.use_cases import (
+    FAILURE,
+    SUCCESS,
+    _GraphTransaction,
+    _map_in_start_order,
+    _register_contract_types,
+    create_report,
+    lint_imports,
+    read_user_options,
+)
+from importlinter.application.user_options import InvalidUserOptions, UserOptions
 from tests.adapters.building import FakeGraphBuilder
+from tests.adapters.filesystem import FakeFileSystem
 from tests.adapters.printing import FakePrinter
 from tests.adapters.timing import FakeTimer
 from tests.adapters.user_options import ExceptionRaisingUserOptionReader, FakeUserOptionReader
+from tests.helpers.contracts import CacheableContract
 
 SOME_CACHE_DIR = "/path/to/some/cache/dir"
 
 
+@pytest.fixture
+def configure_settings() -> FakeFileSystem:
+    """
+    Configure the settings with fakes, and register the contract types used by these tests.
+
+    Returns:
+        The fake file system the settings were configured with.
+    """
+    file_system = FakeFileSystem()
+    settings.configure(
+        GRAPH_BUILDER=FakeGraphBuilder(),
+        PRINTER=FakePrinter(),
+        TIMER=FakeTimer(),
+        FILE_SYSTEM=file_system,
+        DEFAULT_CACHE_DIR=SOME_CACHE_DIR,
+    )
+    _register_contract_types(
+        UserOptions(
+            session_options={
+                "contract_types": [
+                    "always_passes: tests.helpers.contracts.AlwaysPassesContract",
+                    "always_fails: tests.helpers.contracts.AlwaysFailsContract",
+                    "cacheable: tests.helpers.contracts.CacheableContract",
+                    "read_only: tests.helpers.contracts.ReadOnlyContract",
+                    "undeclared: tests.helpers.contracts.UndeclaredMutationContract",
+                ]
+            },
+            contracts_options=[],
+        )
+    )
+    return file_system
+
+
 class TestCheckContractsAndPrintReport:
     def test_all_successful(self):
         self._configure(
@@ -218,6 +265,57 @@ class TestCheckContractsAndPrintReport:
             """
         )
 
+    @pytest.mark.parametrize("jobs", (1, 2))
+    def test_contracts_are_reported_in_order_regardless_of_parallelism(self, jobs):
+        self._configure(
+            contracts_options=[
+                {"type": "always_fails", "name": f"Contract {letter}"}
+                if letter == "c"
+                else {"type": "always_passes", "name": f"Contract {letter}"}
+                for letter in "abcdefgh"
+            ],
+            session_options={"root_package": "mypackage"},
+        )
+
+        result = lint_imports(jobs=jobs)
+
+        assert result == FAILURE
+        settings.PRINTER.pop_and_assert(
+            """
+            =============
+            Import Linter
+            =============
+
+            ---------
+            Contracts
+            ---------
+
+            Analyzed 26 files, 10 dependencies.
+            -----------------------------------
+
+            Contract a KEPT
+            Contract b KEPT
+            Contract c BROKEN
+            Contract d KEPT
+            Contract e KEPT
+            Contract f KEPT
+            Contract g KEPT
+            Contract h KEPT
+
+            Contracts: 7 kept, 1 broken.
+
+
+            ----------------
+            Broken contracts
+            ----------------
+
+            Contract c
+            ----------
+
+            This contract will always fail.
+            """
+        )
+
     def test_timings(self):
         timer = FakeTimer()
         timer.setup(tick_duration=5, increment=10)
@@ -458,6 +556,8 @@ class TestCheckContractsAndPrintReport:
             USER_OPTION_READERS={"foo": reader},
             GRAPH_BUILDER=FakeGraphBuilder(),
             PRINTER=FakePrinter(),
+            FILE_SYSTEM=FakeFileSystem(),
+            DEFAULT_CACHE_DIR=SOME_CACHE_DIR,
         )
 
         with pytest.raises(some_exception.__class__, match=str(some_exception)):
@@ -470,6 +570,8 @@ class TestCheckContractsAndPrintReport:
             USER_OPTION_READERS={"foo": reader},
             GRAPH_BUILDER=FakeGraphBuilder(),
             PRINTER=FakePrinter(),
+            FILE_SYSTEM=FakeFileSystem(),
+            DEFAULT_CACHE_DIR=SOME_CACHE_DIR,
         )
 
         lint_imports(is_debug_mode=False)
@@ -512,6 +614,7 @@ class TestCheckContractsAndPrintReport:
             GRAPH_BUILDER=graph_builder or FakeGraphBuilder(),
             PRINTER=FakePrinter(),
             TIMER=timer or FakeTimer(),
+            FILE_SYSTEM=FakeFileSystem(),
             DEFAULT_CACHE_DIR=SOME_CACHE_DIR,
         )
         if graph is None:
@@ -551,6 +654,215 @@ class TestMultipleRootPackages:
         assert builder.build_arguments["root_package_names"] == root_package_names
 
 
+class TestContractTimings:
+    def test_slowest_contracts_last_time_are_started_first(self, configure_settings):
+        file_system = configure_settings
+        file_system.content_map[f"{SOME_CACHE_DIR}/contract_timings.json"] = json.dumps(
+            {"Contract a": 100, "Contract c": 2000, "Contract d": 500}
+        )
+
+        with patch(
+            "importlinter.application.use_cases._map_in_start_order", wraps=_map_in_start_order
+        ) as spy:
+            report = create_report(
+                user_options=UserOptions(
+                    session_options={"root_packages": ["mypackage"]},
+                    contracts_options=[
+                        {"type": "always_passes", "name": f"Contract {letter}"}
+                        for letter in "abcd"
+                    ],
+                ),
+                jobs=2,
+            )
+
+        [start_order] = [call.args[3] for call in spy.call_args_list]
+        assert start_order == [2, 3, 0, 1]
+        assert [contract.name for contract, _ in report.get_contracts_and_checks()] == [
+            "Contract a",
+            "Contract b",
+            "Contract c",
+            "Contract d",
+        ]
+        written_timings = json.loads(file_system.read(f"{SOME_CACHE_DIR}/contract_timings.json"))
+        assert set(written_timings) == {"Contract a", "Contract b", "Contract c", "Contract d"}
+
+    def test_timings_are_not_rewritten_if_the_start_order_would_not_change(
+        self, configure_settings
+    ):
+        file_system = configure_settings
+        # Each contract will take a second to check, just as they did last time.
+        file_system.content_map[f"{SOME_CACHE_DIR}/contract_timings.json"] = json.dumps(
+            {f"Contract {letter}": 1000 for letter in "abcd"}
+        )
+
+        with patch.object(file_system, "write", wraps=file_system.write) as spy:
+            create_report(
+                user_options=UserOptions(
+                    session_options={"root_packages": ["mypackage"]},
+                    contracts_options=[
+                        {"type": "always_passes", "name": f"Contract {letter}"}
+                        for letter in "abcd"
+                    ],
+                ),
+                jobs=2,
+            )
+
+        spy.assert_not_called()
+
+    def test_timings_of_removed_contracts_are_forgotten(self, configure_settings):
+        file_system = configure_settings
+        file_system.content_map[f"{SOME_CACHE_DIR}/contract_timings.json"] = json.dumps(
+            {"Contract a": 1000, "Removed contract": 2000}
+        )
+
+        create_report(
+            user_options=UserOptions(
+                session_options={"root_packages": ["mypackage"]},
+                contracts_options=[
+                    {"type": "always_passes", "name": f"Contract {letter}"} for letter in "ab"
+                ],
+            ),
+            jobs=2,
+        )
+
+        written_timings = json.loads(file_system.read(f"{SOME_CACHE_DIR}/contract_timings.json"))
+        assert set(written_timings) == {"Contract a", "Contract b"}
+
+    def test_timings_are_not_used_when_checking_in_a_single_process(self, configure_settings):
+        file_system = configure_settings
+
+        with patch.object(file_system, "read", wraps=file_system.read) as read_spy, patch.object(
+            file_system, "write", wraps=file_system.write
+        ) as write_spy:
+            create_report(
+                user_options=UserOptions(
+                    session_options={"root_packages": ["mypackage"]},
+                    contracts_options=[
+                        {"type": "always_passes", "name": f"Contract {letter}"}
+                        for letter in "abcd"
+                    ],
+                ),
+            )
+
+        read_spy.assert_not_called()
+        write_spy.assert_not_called()
+
+    def test_map_in_start_order(self):
+        calls = []
+
+        def record(value):
+            calls.append(value)
+            return value * 10
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = list(
+                _map_in_start_order(executor, record, [(0,), (1,), (2,)], start_order=[2, 0, 1])
+            )
+
+        assert calls == [2, 0, 1]
+        assert results == [0, 10, 20]
+
+
+class TestResultsCache:
+    def _create_report(self, graph, cache_dir=SOME_CACHE_DIR, **contract_options):
+        settings.GRAPH_BUILDER.inject_graph(graph)
+        return create_report(
+            cache_dir=cache_dir,
+            user_options=UserOptions(
+                session_options={"root_packages": ["mypackage"]},
+                contracts_options=[
+                    {"type": "cacheable", "name": "Contract", **contract_options},
+                    {"type": "always_passes", "name": "Uncacheable contract"},
+                ],
+            ),
+        )
+
+    def _build_graph(self) -> ImportGraph:
+        graph = ImportGraph()
+        graph.add_import(
+            importer="mypackage.blue",
+            imported="mypackage.green",
+            line_number=1,
+            line_contents="from . import green",
+        )
+        return graph
+
+    @pytest.fixture(autouse=True)
+    def configure(self, configure_settings):
+        self.file_system = configure_settings
+        CacheableContract.check_count = 0
+
+    def test_result_is_reused_for_same_graph_and_options(self):
+        self._create_report(self._build_graph())
+        report = self._create_report(self._build_graph())
+
+        assert CacheableContract.check_count == 1
+        assert [contract.name for contract, _ in report.get_contracts_and_checks()] == [
+            "Contract",
+            "Uncacheable contract",
+        ]
+        assert report.contains_failures is False
+
+    def test_result_is_not_reused_if_graph_changes(self):
+        self._create_report(self._build_graph())
+        graph = self._build_graph()
+        graph.add_import(
+            importer="mypackage.green",
+            imported="mypackage.yellow",
+            line_number=1,
+            line_contents="from . import yellow",
+        )
+        self._create_report(graph)
+
+        assert CacheableContract.check_count == 2
+
+    def test_result_is_not_reused_if_options_change(self):
+        self._create_report(self._build_graph())
+        self._create_report(self._build_graph(), extra_option="changed")
+
+        assert CacheableContract.check_count == 2
+
+    def test_cached_result_is_the_same_as_the_original(self):
+        [(_, original_check), _] = self._create_report(
+            self._build_graph()
+        ).get_contracts_and_checks()
+        [(_, cached_check), _] = self._create_report(
+            self._build_graph()
+        ).get_contracts_and_checks()
+
+        assert CacheableContract.check_count == 1
+        assert original_check.metadata == {"modules": {"mypackage.blue", "mypackage.green"}}
+        # Sets are stored as sorted lists.
+        assert cached_check.metadata == {"modules": ["mypackage.blue", "mypackage.green"]}
+        assert (cached_check.kept, cached_check.warnings) == (
+            original_check.kept,
+            original_check.warnings,
+        )
+
+    @pytest.mark.parametrize("contents", ("corrupted", "[]", '{"kept": true}'))
+    def test_unreadable_cache_is_ignored(self, contents):
+        self._create_report(self._build_graph())
+        for file_name in self._get_results_file_names():
+            self.file_system.content_map[file_name] = contents
+        self._create_report(self._build_graph())
+
+        assert CacheableContract.check_count == 2
+
+    def test_results_are_not_cached_without_cache_dir(self):
+        self._create_report(self._build_graph(), cache_dir=None)
+        self._create_report(self._build_graph(), cache_dir=None)
+
+        assert CacheableContract.check_count == 2
+        assert self._get_results_file_names() == []
+
+    def _get_results_file_names(self) -> List[str]:
+        return [
+            file_name
+            for file_name in self.file_system.content_map
+            if file_name.startswith(f"{SOME_CACHE_DIR}/results/")
+        ]
+
+
 class TestGraphCopying:
     def test_graph_can_be_mutated_without_affecting_other_contracts(self):
         # The MutationCheckContract checks that there are a certain number of modules and imports
@@ -584,6 +896,9 @@ class TestGraphCopying:
             USER_OPTION_READERS={"foo": reader},
             GRAPH_BUILDER=FakeGraphBuilder(),
             PRINTER=FakePrinter(),
+            TIMER=FakeTimer(),
+            FILE_SYSTEM=FakeFileSystem(),
+            DEFAULT_CACHE_DIR=SOME_CACHE_DIR,
         )
 
         graph = ImportGraph()
@@ -600,6 +915,43 @@ class TestGraphCopying:
 
         assert result == SUCCESS
 
+    @pytest.mark.usefixtures("configure_settings")
+    def test_graph_is_shared_by_contracts_that_dont_mutate_it(self):
+        report = create_report(
+            user_options=UserOptions(
+                session_options={"root_packages": ["mypackage"]},
+                contracts_options=[
+                    {"type": "read_only", "name": "Contract one"},
+                    {"type": "read_only", "name": "Contract two"},
+                ],
+            ),
+        )
+
+        # Each contract is given a read-only wrapper around the same graph.
+        [graph_one, graph_two] = [
+            check.metadata["graph"]._graph for _, check in report.get_contracts_and_checks()
+        ]
+        assert graph_one is graph_two
+
+    @pytest.mark.usefixtures("configure_settings")
+    def test_contracts_that_say_they_dont_mutate_the_graph_cannot(self):
+        with pytest.raises(
+            RuntimeError,
+            match=(
+                'Contract "Contract two" tried to mutate the graph, '
+                "but its mutates_graph property is False."
+            ),
+        ):
+            create_report(
+                user_options=UserOptions(
+                    session_options={"root_packages": ["mypackage"]},
+                    contracts_options=[
+                        {"type": "read_only", "name": "Contract one"},
+                        {"type": "undeclared", "name": "Contract two"},
+                    ],
+                ),
+            )
+
 
 class TestCreateReport:
     @pytest.mark.parametrize(
@@ -646,6 +998,130 @@ class TestCreateReport:
                 limit_to_contracts=limit_to_contracts,
             )
 
+    def test_raises_invalid_user_options_for_unknown_contract_types_before_building_graph(
+        self,
+    ):
+        builder = FakeGraphBuilder()
+        settings.configure(GRAPH_BUILDER=builder, PRINTER=FakePrinter())
+        _register_contract_types(UserOptions(session_options={}, contracts_options=[]))
+
+        with pytest.raises(
+            InvalidUserOptions,
+            match=re.escape(
+                "Unknown contract types: 'forbiden' (used by contract 'Contract one'), "
+                "'layerz' (used by contract 'Contract three')."
+            ),
+        ):
+            create_report(
+                user_options=UserOptions(
+                    session_options={"root_packages": ["mypackage"]},
+                    contracts_options=[
+                        {"type": "forbiden", "name": "Contract one"},
+                        {"type": "layers", "name": "Contract two"},
+                        {"type": "layerz", "name": "Contract three"},
+                    ],
+                ),
+            )
+
+        assert not hasattr(builder, "build_arguments")
+
+    @pytest.mark.usefixtures("configure_settings")
+    def test_streaming_report_outputs_results_as_they_are_added(self):
+        report = create_report(
+            user_options=UserOptions(
+                session_options={"root_packages": ["mypackage"]},
+                contracts_options=[
+                    {"type": "always_passes", "name": "Contract one"},
+                    {"type": "always_fails", "name": "Contract two"},
+                ],
+            ),
+            report_class=StreamingReport,
+        )
+
+        settings.PRINTER.pop_and_assert(
+            """
+            ---------
+            Contracts
+            ---------
+
+            Analyzed 0 files, 0 dependencies.
+            ---------------------------------
+
+            Contract one KEPT
+            Contract two BROKEN
+            """
+        )
+        assert (report.kept_count, report.broken_count) == (1, 1)
+
+    def test_streaming_report_says_it_is_incomplete_if_a_contract_raises(self):
+        reader = FakeUserOptionReader(
+            UserOptions(
+                session_options={
+                    "root_packages": ["mypackage"],
+                    "contract_types": [
+                        "always_passes: tests.helpers.contracts.AlwaysPassesContract",
+                        "undeclared: tests.helpers.contracts.UndeclaredMutationContract",
+                    ],
+                },
+                contracts_options=[
+                    {"type": "always_passes", "name": "Contract one"},
+                    {"type": "undeclared", "name": "Contract two"},
+                ],
+            )
+        )
+        settings.configure(
+            USER_OPTION_READERS={"foo": reader},
+            GRAPH_BUILDER=FakeGraphBuilder(),
+            PRINTER=FakePrinter(),
+            TIMER=FakeTimer(),
+            FILE_SYSTEM=FakeFileSystem(),
+            DEFAULT_CACHE_DIR=SOME_CACHE_DIR,
+        )
+
+        result = lint_imports()
+
+        assert result == FAILURE
+        settings.PRINTER.pop_and_assert(
+            """
+            =============
+            Import Linter
+            =============
+
+            ---------
+            Contracts
+            ---------
+
+            Analyzed 0 files, 0 dependencies.
+            ---------------------------------
+
+            Contract one KEPT
+
+            Could not finish checking the contracts; this report is incomplete.
+
+            Contract "Contract two" tried to mutate the graph, but its mutates_graph property is False.
+            """  # noqa: E501
+        )
+
+
+class TestRegisterContractTypes:
+    @pytest.mark.parametrize(
+        "contract_type_string, expected_exception",
+        (
+            ("always_passes tests.helpers.contracts.AlwaysPassesContract", InvalidUserOptions),
+            ("a: b: tests.helpers.contracts.AlwaysPassesContract", InvalidUserOptions),
+            ("some_string: string.ascii_lowercase", TypeError),
+            ("some_class: tests.adapters.printing.FakePrinter", TypeError),
+        ),
+    )
+    def test_invalid_contract_type(self, contract_type_string, expected_exception):
+        with pytest.raises(expected_exception):
+            _register_contract_types(
+                UserOptions(
+                    session_options={"contract_types": [contract_type_string]},
+                    contracts_options=[],
+                )
+            )
+
 
 class TestReadUserOptions:
     @pytest.mark.parametrize("filename", [".importlinter", "setup.cfg", "foo", "foo.bar"])
@@ -675,3 +1151,71 @@ class TestReadUserOptions:
         )
         with pytest.raises(RuntimeError, match="expected"):
             lint_imports(filename, is_debug_mode=True)
+
+    def test_normalizing_does_not_mutate_options_read(self):
+        contract_options = {"type": "forbidden", "name": "Contract one"}
+        user_options = UserOptions(
+            session_options={"root_package": "mypackage"}, contracts_options=[contract_options]
+        )
+        settings.configure(USER_OPTION_READERS={"foo": FakeUserOptionReader(user_options)})
+
+        normalized_options = read_user_options()
+
+        assert normalized_options.session_options == {"root_packages": ["mypackage"]}
+        assert user_options.session_options == {"root_package": "mypackage"}
+        assert normalized_options.contracts_options == [contract_options]
+        assert normalized_options.contracts_options[0] is not contract_options
+
+
+class TestGraphTransaction:
+    def _build_graph(self) -> ImportGraph:
+        graph = ImportGraph()
+        graph.add_import(
+            importer="mypackage.a",
+            imported="mypackage.b",
+            line_number=1,
+            line_contents="from . import b",
+        )
+        graph.add_import(
+            importer="mypackage.a",
+            imported="mypackage.b",
+            line_number=2,
+            line_contents="from .b import foo",
+        )
+        graph.add_import(importer="mypackage.b", imported="mypackage.c")
+        return graph
+
+    def test_removed_imports_are_put_back(self):
+        graph = self._build_graph()
+
+        with _GraphTransaction(graph) as graph_in_transaction:
+            graph_in_transaction.remove_import(importer="mypackage.a", imported="mypackage.b")
+            graph_in_transaction.remove_import(importer="mypackage.b", imported="mypackage.c")
+            assert graph.count_imports() == 0
+
+        assert graph.count_imports() == 2
+        assert graph.direct_import_exists(importer="mypackage.b", imported="mypackage.c")
+        assert [
+            details["line_number"]
+            for details in graph.get_import_details(importer="mypackage.a", imported="mypackage.b")
+        ] == [1, 2]
+
+    def test_switches_to_copy_for_other_mutations(self):
+        graph = self._build_graph()
+
+        with _GraphTransaction(graph) as graph_in_transaction:
+            graph_in_transaction.remove_import(importer="mypackage.b", imported="mypackage.c")
+            graph_in_transaction.add_import(importer="mypackage.c", imported="mypackage.d")
+
+            assert graph_in_transaction.modules == {
+                "mypackage.a",
+                "mypackage.b",
+                "mypackage.c",
+                "mypackage.d",
+            }
+            assert not graph_in_transaction.direct_import_exists(
+                importer="mypackage.b", imported="mypackage.c"
+            )
+            # The original has already been put back.
+            assert graph.modules == {"mypackage.a", "mypackage.b", "mypackage.c"}
+            assert graph.count_imports() == 2
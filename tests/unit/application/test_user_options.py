@@ -5,3 +5,13 @@ def test_user_options_returns_false_on_unsupported_type_for_equality():
     options = UserOptions(session_options={}, contracts_options=[])
     result = options == 1
     assert result is False
+
+
+def test_user_options_equal_themselves_without_comparing_contents():
+    class UncomparableOption:
+        def __eq__(self, other):
+            raise AssertionError("Options should not have been compared.")
+
+    options = UserOptions(session_options={"option": UncomparableOption()}, contracts_options=[])
+
+    assert options == options
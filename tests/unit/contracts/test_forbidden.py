@@ -153,6 +153,22 @@ class TestForbiddenContract:
         check = contract.check(graph=graph, verbose=False)
         assert check.kept
 
+    @pytest.mark.parametrize(
+        "ignore_imports, expected_result",
+        (
+            (None, False),
+            (("mypackage.three -> mypackage.green",), True),
+        ),
+    )
+    def test_mutates_graph_only_if_there_are_ignored_imports(
+        self, ignore_imports, expected_result
+    ):
+        contract = self._build_contract(
+            forbidden_modules=("mypackage.blue",), ignore_imports=ignore_imports
+        )
+
+        assert contract.mutates_graph is expected_result
+
     def test_wildcards_in_source_modules_are_resolved(self):
         graph = self._build_graph()
         contract = self._build_contract(
@@ -102,3 +102,18 @@ class TestContractRegistry:
                 registry.get_contract_class(name)
         else:
             assert expected_result == registry.get_contract_class(name)
+
+    def test_registry_imports_class_from_string_when_first_used(self):
+        registry = ContractRegistry()
+
+        registry.register("tests.unit.domain.test_contract.MyContract", name="foo")
+
+        assert registry.get_contract_class("foo") is MyContract
+
+    def test_registry_raises_type_error_for_non_contract_string(self):
+        registry = ContractRegistry()
+
+        registry.register("tests.unit.domain.test_contract.ContractRegistry", name="foo")
+
+        with pytest.raises(TypeError):
+            registry.get_contract_class("foo")